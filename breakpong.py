@@ -59,6 +59,7 @@ PADDLE_WIDTH, PADDLE_HEIGHT = 10, 60
 BALL_SIZE = 10
 BALL_SPEED = 4
 PADDLE_SPEED = 5
+MAX_SPEED = 6  # Ball speed is clamped to this after a paddle hit
 
 # Two rows of bricks: top (y=0) and bottom (y=HEIGHT - BRICK_HEIGHT).
 BRICK_COLUMNS = 8
@@ -294,360 +295,388 @@ def check_for_winner():
         game_winner = "RIGHT"
         current_state = STATE_GAME_OVER
 
+def start_match(now):
+    """
+    Fresh match from the menu: zero scores, normal-size paddles,
+    centred ball and a new set of bricks.
+    """
+    global score_left, score_right, timer_start, current_state
+    score_left = 0
+    score_right = 0
+    # Reset paddle sizes in case they were enlarged
+    paddle_left.height = PADDLE_HEIGHT
+    paddle_right.height = PADDLE_HEIGHT
+    reset_paddles()
+    reset_ball()
+    create_bricks()
+    power_ups.clear()
+    timer_start = now
+    current_state = STATE_INITIAL_COUNTDOWN
+
+def expire_power_ups(now):
+    if now >= paddle_left_end_power_time:
+        paddle_left.height = PADDLE_HEIGHT
+    if now >= paddle_right_end_power_time:
+        paddle_right.height = PADDLE_HEIGHT
+
+def move_paddles(left_up, left_down, right_up, right_down):
+    """
+    Move the paddles for one frame and remember their vertical speed
+    so update_ball() can apply spin.
+    """
+    global paddle_left_speed, paddle_right_speed
+    paddle_left_speed = 0
+    paddle_right_speed = 0
+
+    # Left paddle
+    if left_up and paddle_left.top > 0:
+        paddle_left.y -= PADDLE_SPEED
+        paddle_left_speed = -PADDLE_SPEED
+    elif left_down and paddle_left.bottom < HEIGHT:
+        paddle_left.y += PADDLE_SPEED
+        paddle_left_speed = PADDLE_SPEED
+
+    # Right paddle
+    if right_up and paddle_right.top > 0:
+        paddle_right.y -= PADDLE_SPEED
+        paddle_right_speed = -PADDLE_SPEED
+    elif right_down and paddle_right.bottom < HEIGHT:
+        paddle_right.y += PADDLE_SPEED
+        paddle_right_speed = PADDLE_SPEED
+
+def update_ball(now):
+    """
+    One frame of GAME-state physics: move the ball, bounce it off the
+    walls and paddles, award points and break bricks. Kept free of any
+    drawing so fuzz_physics.py can drive it headless.
+    """
+    global ball_dx, ball_dy, last_hit, score_left, score_right, timer_start, current_state
+    global paddle_left_end_power_time, paddle_right_end_power_time
+
+    # Move the ball
+    ball.x += ball_dx
+    ball.y += ball_dy
+
+    # Collide with top/bottom edges
+    if ball.top <= 0 or ball.bottom >= HEIGHT:
+        ball_dy = -ball_dy
+
+    # --- NEW: Spin logic ---
+    # Check collisions with paddles
+    if ball.colliderect(paddle_left):
+        ball_dx = abs(ball_dx)
+        last_hit = "left"
+        # Add spin while maintaining constant speed
+        ball_dy += paddle_left_speed * 0.1  # Reduced multiplier
+        ball_dy += (paddle_left.centery - ball.centery) * 0.05  # Angle adjustment
+        ball.x += 5  # Move the ball slightly away from the paddle
+
+        # Normalize the speed
+        speed = (ball_dx * ball_dx + ball_dy * ball_dy) ** 0.5
+        if speed > MAX_SPEED:
+            ball_dx = (ball_dx / speed) * MAX_SPEED
+            ball_dy = (ball_dy / speed) * MAX_SPEED
+
+    if ball.colliderect(paddle_right):
+        ball_dx = -abs(ball_dx)
+        last_hit = "right"
+        # Add spin while maintaining constant speed
+        ball_dy += paddle_right_speed * 0.1  # Reduced multiplier
+        ball_dy += (paddle_right.centery - ball.centery) * 0.05  # Angle adjustment
+        ball.x -= 5  # Move the ball slightly away from the paddle
+
+        # Normalize the speed
+        speed = (ball_dx * ball_dx + ball_dy * ball_dy) ** 0.5
+        if speed > MAX_SPEED:
+            ball_dx = (ball_dx / speed) * MAX_SPEED
+            ball_dy = (ball_dy / speed) * MAX_SPEED
+
+    # Lost round
+    if ball.left <= 0:
+        # Right scores
+        score_right += 1
+        reset_ball()
+        reset_paddles()
+        timer_start = now
+        current_state = STATE_GRACE
+        check_for_winner()
+    elif ball.right >= WIDTH:
+        # Left scores
+        score_left += 1
+        reset_ball()
+        reset_paddles()
+        timer_start = now
+        current_state = STATE_GRACE
+        check_for_winner()
+
+    # Collide with bricks
+    # If a brick is destroyed, give power-up to the player who hit it
+    for i, (brick_rect, brick_color) in enumerate(bricks):
+        if ball.colliderect(brick_rect):
+            del bricks[i]
+            ball_dy = -ball_dy
+            # 20% chance to get a power-up
+            if random.random() < 0.2:
+                # Give power-up to the last player who hit the ball
+                if last_hit == "left":
+                    paddle_left.height = int(paddle_left.height * 1.5)
+                    paddle_left.centery = paddle_left.centery
+                    paddle_left_end_power_time = now + POWERUP_DURATION
+                elif last_hit == "right":
+                    paddle_right.height = int(paddle_right.height * 1.5)
+                    paddle_right.centery = paddle_right.centery
+                    paddle_right_end_power_time = now + POWERUP_DURATION
+            break
+
 # --------------------
 # Main Loop
 # --------------------
-clock = pygame.time.Clock()
-running = True
-
-create_bricks()  # top & bottom
-while running:
-    dt = clock.get_time() / 1000.0
-    clock.tick(60)
-
-    # --------------------
-    # Event Handling
-    # --------------------
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-
-        # If not in INTRO/MENU/GAME_OVER, the EXIT button can return to MENU
-        if current_state not in (STATE_INTRO, STATE_MENU, STATE_GAME_OVER) and event.type == pygame.MOUSEBUTTONDOWN:
-            if check_button_click(exit_button_rect):
+if __name__ == "__main__":
+    clock = pygame.time.Clock()
+    running = True
+
+    create_bricks()  # top & bottom
+    while running:
+        dt = clock.get_time() / 1000.0
+        clock.tick(60)
+
+        # --------------------
+        # Event Handling
+        # --------------------
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+
+            # If not in INTRO/MENU/GAME_OVER, the EXIT button can return to MENU
+            if current_state not in (STATE_INTRO, STATE_MENU, STATE_GAME_OVER) and event.type == pygame.MOUSEBUTTONDOWN:
+                if check_button_click(exit_button_rect):
+                    current_state = STATE_MENU
+
+            # Intro skip
+            if current_state == STATE_INTRO and event.type == pygame.KEYDOWN:
                 current_state = STATE_MENU
 
-        # Intro skip
-        if current_state == STATE_INTRO and event.type == pygame.KEYDOWN:
-            current_state = STATE_MENU
-
-        # Menu button clicks
-        if current_state == STATE_MENU:
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if check_button_click(start_button_rect):
-                    score_left = 0
-                    score_right = 0
-                    # Reset paddle sizes in case they were enlarged
-                    paddle_left.height = PADDLE_HEIGHT
-                    paddle_right.height = PADDLE_HEIGHT
-                    reset_paddles()
-                    reset_ball()
-                    create_bricks()
-                    power_ups.clear()
-                    timer_start = pygame.time.get_ticks()
-                    current_state = STATE_INITIAL_COUNTDOWN
-                elif check_button_click(help_button_rect):
-                    current_state = STATE_HELP
-                elif check_button_click(settings_button_rect):
-                    current_state = STATE_SETTINGS
+            # Menu button clicks
+            if current_state == STATE_MENU:
+                if event.type == pygame.MOUSEBUTTONDOWN:
+                    if check_button_click(start_button_rect):
+                        start_match(pygame.time.get_ticks())
+                    elif check_button_click(help_button_rect):
+                        current_state = STATE_HELP
+                    elif check_button_click(settings_button_rect):
+                        current_state = STATE_SETTINGS
+
+            elif current_state == STATE_HELP:
+                if event.type == pygame.KEYDOWN:
+                    current_state = STATE_MENU
 
-        elif current_state == STATE_HELP:
-            if event.type == pygame.KEYDOWN:
+            elif current_state == STATE_SETTINGS:
+                if event.type == pygame.KEYDOWN:
+                    current_state = STATE_MENU
+                elif event.type == pygame.MOUSEBUTTONDOWN:
+                    if check_button_click(win_score_5_rect):
+                        winning_score = 5
+                    elif check_button_click(win_score_10_rect):
+                        winning_score = 10
+                    elif check_button_click(win_score_15_rect):
+                        winning_score = 15
+
+            elif current_state in (STATE_INITIAL_COUNTDOWN, STATE_GAME, STATE_GRACE):
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                    current_state = STATE_MENU
+
+            elif current_state == STATE_GAME_OVER:
+                if event.type == pygame.MOUSEBUTTONDOWN:
+                    if check_button_click(menu_button_rect):
+                        current_state = STATE_MENU
+
+        # --------------------
+        # State-Specific Logic
+        # --------------------
+        # --- Update paddle sizes if a power-up effect expired ---
+        current_time = pygame.time.get_ticks()
+        expire_power_ups(current_time)
+
+        if current_state == STATE_GAME:
+            keys = pygame.key.get_pressed()
+            move_paddles(keys[pygame.K_w], keys[pygame.K_s], keys[pygame.K_UP], keys[pygame.K_DOWN])
+
+        # --------------------
+        # Drawing / Updates per State
+        # --------------------
+        if current_state == STATE_INTRO:
+            screen.fill(BLACK)
+            # Particle logic
+            for _ in range(3):
+                particles.append(Particle())
+            for p in particles[:]:
+                p.update(dt)
+                p.draw(screen)
+                if p.is_dead():
+                    particles.remove(p)
+
+            elapsed = pygame.time.get_ticks() - intro_start_time
+            if elapsed < 2000:
+                alpha = int((elapsed / 2000) * 255)
+            elif elapsed < 3000:
+                alpha = 255
+            elif elapsed < 4000:
+                alpha = int(255 - ((elapsed - 3000) / 1000) * 255)
+            else:
                 current_state = STATE_MENU
+                continue
+
+            logo_surface = title_font.render("BreakPong", True, TITLE_COLOR).convert_alpha()
+            credits_surface = help_font.render("A Retro Mashup", True, WHITE).convert_alpha()
+            by_surface = help_font.render("By: @amro212", True, WHITE).convert_alpha()
+            logo_surface.set_alpha(alpha)
+            credits_surface.set_alpha(alpha)
+            by_surface.set_alpha(alpha)
+            logo_rect = logo_surface.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 30))
+            credits_rect = credits_surface.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 30))
+            by_rect = by_surface.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 60))
+            screen.blit(logo_surface, logo_rect)
+            screen.blit(credits_surface, credits_rect)
+            screen.blit(by_surface, by_rect)
+
+            if elapsed > 3000:
+                overlay_alpha = int(((elapsed - 3000) / 1000) * 255)
+                draw_menu_overlay(overlay_alpha)
+
+        elif current_state == STATE_MENU:
+            draw_gradient_background(screen, (40, 0, 70), (0, 0, 0))
+            render_text_centered("BreakPong", title_font, TITLE_COLOR, HEIGHT // 4)
+            draw_button(start_button_rect, "START")
+            draw_button(help_button_rect, "HELP")
+            draw_button(settings_button_rect, "SETTINGS")
+
+        elif current_state == STATE_HELP:
+            screen.fill(BLACK)
+            render_text_centered("HELP", title_font, TITLE_COLOR, 60)
+            lines = [
+                "Controls:",
+                "  Left Paddle: W/S",
+                "  Right Paddle: Up/Down",
+                "",
+                "Angle/Spin:",
+                "  Moving the paddle up or down at impact adds spin!",
+                "",
+                "Power-Ups:",
+                "  Breaking a brick may drop a power-up that",
+                "  temporarily enlarges your paddle if collected.",
+                "",
+                "(Press any key to return)"
+            ]
+            y_offset = 120
+            for line in lines:
+                render_text_centered(line, help_font, WHITE, y_offset)
+                y_offset += 35
+            draw_button(exit_button_rect, "EXIT")
 
         elif current_state == STATE_SETTINGS:
-            if event.type == pygame.KEYDOWN:
-                current_state = STATE_MENU
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if check_button_click(win_score_5_rect):
-                    winning_score = 5
-                elif check_button_click(win_score_10_rect):
-                    winning_score = 10
-                elif check_button_click(win_score_15_rect):
-                    winning_score = 15
-
-        elif current_state in (STATE_INITIAL_COUNTDOWN, STATE_GAME, STATE_GRACE):
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                current_state = STATE_MENU
+            screen.fill(BLACK)
+            render_text_centered("SETTINGS", title_font, TITLE_COLOR, 60)
+            lines = [
+                "Select a winning score:",
+                "First player to reach this score wins!",
+                ""
+            ]
+            y_offset = 150
+            for line in lines:
+                render_text_centered(line, help_font, WHITE, y_offset)
+                y_offset += 40
+
+            draw_button(win_score_5_rect, "5")
+            draw_button(win_score_10_rect, "10")
+            draw_button(win_score_15_rect, "15")
+
+            current_setting_text = f"Current Winning Score: {winning_score}"
+            render_text_centered(current_setting_text, help_font, WHITE, HEIGHT - 40)
+
+            draw_button(exit_button_rect, "EXIT")
+
+        elif current_state == STATE_INITIAL_COUNTDOWN:
+            screen.fill(BLACK)
+            pygame.draw.rect(screen, WHITE, paddle_left)
+            pygame.draw.rect(screen, WHITE, paddle_right)
+            pygame.draw.ellipse(screen, WHITE, ball)
+            for (brick_rect, brick_color) in bricks:
+                pygame.draw.rect(screen, brick_color, brick_rect)
+
+            # Score
+            score_text = score_font.render(f"{score_left} : {score_right}", True, WHITE)
+            score_rect = score_text.get_rect(center=(WIDTH // 2, 35))
+            screen.blit(score_text, score_rect)
+
+            elapsed = pygame.time.get_ticks() - timer_start
+            if elapsed < 1000:
+                countdown_str = "3"
+            elif elapsed < 2000:
+                countdown_str = "2"
+            elif elapsed < 3000:
+                countdown_str = "1"
+            elif elapsed < 3500:
+                countdown_str = "GO!"
+            else:
+                current_state = STATE_GAME
+                countdown_str = ""
 
-        elif current_state == STATE_GAME_OVER:
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if check_button_click(menu_button_rect):
-                    current_state = STATE_MENU
+            if countdown_str:
+                c_text = title_font.render(countdown_str, True, TITLE_COLOR)
+                c_rect = c_text.get_rect(center=(WIDTH // 2, HEIGHT // 2))
+                screen.blit(c_text, c_rect)
 
-    # --------------------
-    # State-Specific Logic
-    # --------------------
-    # --- Update paddle sizes if a power-up effect expired ---
-    current_time = pygame.time.get_ticks()
-    if current_time >= paddle_left_end_power_time:
-        paddle_left.height = PADDLE_HEIGHT
-    if current_time >= paddle_right_end_power_time:
-        paddle_right.height = PADDLE_HEIGHT
+            draw_button(exit_button_rect, "EXIT")
 
-    # Movement keys for spin tracking:
-    # We'll set the paddle_*_speed so we can adjust ball_dy upon collision.
-    paddle_left_speed = 0
-    paddle_right_speed = 0
+        elif current_state == STATE_GAME:
+            # --- Paddle movement logic was done above ---
+            update_ball(current_time)
 
-    if current_state == STATE_GAME:
-        keys = pygame.key.get_pressed()
-        # Left paddle
-        if keys[pygame.K_w] and paddle_left.top > 0:
-            paddle_left.y -= PADDLE_SPEED
-            paddle_left_speed = -PADDLE_SPEED
-        elif keys[pygame.K_s] and paddle_left.bottom < HEIGHT:
-            paddle_left.y += PADDLE_SPEED
-            paddle_left_speed = PADDLE_SPEED
-
-        # Right paddle
-        if keys[pygame.K_UP] and paddle_right.top > 0:
-            paddle_right.y -= PADDLE_SPEED
-            paddle_right_speed = -PADDLE_SPEED
-        elif keys[pygame.K_DOWN] and paddle_right.bottom < HEIGHT:
-            paddle_right.y += PADDLE_SPEED
-            paddle_right_speed = PADDLE_SPEED
-
-    # --------------------
-    # Drawing / Updates per State
-    # --------------------
-    if current_state == STATE_INTRO:
-        screen.fill(BLACK)
-        # Particle logic
-        for _ in range(3):
-            particles.append(Particle())
-        for p in particles[:]:
-            p.update(dt)
-            p.draw(screen)
-            if p.is_dead():
-                particles.remove(p)
-
-        elapsed = pygame.time.get_ticks() - intro_start_time
-        if elapsed < 2000:
-            alpha = int((elapsed / 2000) * 255)
-        elif elapsed < 3000:
-            alpha = 255
-        elif elapsed < 4000:
-            alpha = int(255 - ((elapsed - 3000) / 1000) * 255)
-        else:
-            current_state = STATE_MENU
-            continue
-
-        logo_surface = title_font.render("BreakPong", True, TITLE_COLOR).convert_alpha()
-        credits_surface = help_font.render("A Retro Mashup", True, WHITE).convert_alpha()
-        by_surface = help_font.render("By: @amro212", True, WHITE).convert_alpha()
-        logo_surface.set_alpha(alpha)
-        credits_surface.set_alpha(alpha)
-        by_surface.set_alpha(alpha)
-        logo_rect = logo_surface.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 30))
-        credits_rect = credits_surface.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 30))
-        by_rect = by_surface.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 60))
-        screen.blit(logo_surface, logo_rect)
-        screen.blit(credits_surface, credits_rect)
-        screen.blit(by_surface, by_rect)
-
-        if elapsed > 3000:
-            overlay_alpha = int(((elapsed - 3000) / 1000) * 255)
-            draw_menu_overlay(overlay_alpha)
-
-    elif current_state == STATE_MENU:
-        draw_gradient_background(screen, (40, 0, 70), (0, 0, 0))
-        render_text_centered("BreakPong", title_font, TITLE_COLOR, HEIGHT // 4)
-        draw_button(start_button_rect, "START")
-        draw_button(help_button_rect, "HELP")
-        draw_button(settings_button_rect, "SETTINGS")
-
-    elif current_state == STATE_HELP:
-        screen.fill(BLACK)
-        render_text_centered("HELP", title_font, TITLE_COLOR, 60)
-        lines = [
-            "Controls:",
-            "  Left Paddle: W/S",
-            "  Right Paddle: Up/Down",
-            "",
-            "Angle/Spin:",
-            "  Moving the paddle up or down at impact adds spin!",
-            "",
-            "Power-Ups:",
-            "  Breaking a brick may drop a power-up that",
-            "  temporarily enlarges your paddle if collected.",
-            "",
-            "(Press any key to return)"
-        ]
-        y_offset = 120
-        for line in lines:
-            render_text_centered(line, help_font, WHITE, y_offset)
-            y_offset += 35
-        draw_button(exit_button_rect, "EXIT")
-
-    elif current_state == STATE_SETTINGS:
-        screen.fill(BLACK)
-        render_text_centered("SETTINGS", title_font, TITLE_COLOR, 60)
-        lines = [
-            "Select a winning score:",
-            "First player to reach this score wins!",
-            ""
-        ]
-        y_offset = 150
-        for line in lines:
-            render_text_centered(line, help_font, WHITE, y_offset)
-            y_offset += 40
-
-        draw_button(win_score_5_rect, "5")
-        draw_button(win_score_10_rect, "10")
-        draw_button(win_score_15_rect, "15")
-
-        current_setting_text = f"Current Winning Score: {winning_score}"
-        render_text_centered(current_setting_text, help_font, WHITE, HEIGHT - 40)
-
-        draw_button(exit_button_rect, "EXIT")
-
-    elif current_state == STATE_INITIAL_COUNTDOWN:
-        screen.fill(BLACK)
-        pygame.draw.rect(screen, WHITE, paddle_left)
-        pygame.draw.rect(screen, WHITE, paddle_right)
-        pygame.draw.ellipse(screen, WHITE, ball)
-        for (brick_rect, brick_color) in bricks:
-            pygame.draw.rect(screen, brick_color, brick_rect)
-
-        # Score
-        score_text = score_font.render(f"{score_left} : {score_right}", True, WHITE)
-        score_rect = score_text.get_rect(center=(WIDTH // 2, 35))
-        screen.blit(score_text, score_rect)
-
-        elapsed = pygame.time.get_ticks() - timer_start
-        if elapsed < 1000:
-            countdown_str = "3"
-        elif elapsed < 2000:
-            countdown_str = "2"
-        elif elapsed < 3000:
-            countdown_str = "1"
-        elif elapsed < 3500:
-            countdown_str = "GO!"
-        else:
-            current_state = STATE_GAME
-            countdown_str = ""
-
-        if countdown_str:
-            c_text = title_font.render(countdown_str, True, TITLE_COLOR)
-            c_rect = c_text.get_rect(center=(WIDTH // 2, HEIGHT // 2))
-            screen.blit(c_text, c_rect)
-
-        draw_button(exit_button_rect, "EXIT")
-
-    elif current_state == STATE_GAME:
-        # --- Paddle movement logic was done above ---
-        # Move the ball
-        ball.x += ball_dx
-        ball.y += ball_dy
-
-        # Collide with top/bottom edges
-        if ball.top <= 0 or ball.bottom >= HEIGHT:
-            ball_dy = -ball_dy
+            # Draw everything
+            screen.fill(BLACK)
+            pygame.draw.rect(screen, WHITE, paddle_left)
+            pygame.draw.rect(screen, WHITE, paddle_right)
+            pygame.draw.ellipse(screen, WHITE, ball)
 
-        # --- NEW: Spin logic ---
-        # Check collisions with paddles
-        if ball.colliderect(paddle_left):
-            MAX_SPEED = 6
-            ball_dx = abs(ball_dx)
-            last_hit = "left"
-            # Add spin while maintaining constant speed
-            ball_dy += paddle_left_speed * 0.1  # Reduced multiplier
-            ball_dy += (paddle_left.centery - ball.centery) * 0.05  # Angle adjustment
-            ball.x += 5  # Move the ball slightly away from the paddle
-
-            # Normalize the speed
-            speed = (ball_dx * ball_dx + ball_dy * ball_dy) ** 0.5
-            if speed > MAX_SPEED:
-                ball_dx = (ball_dx / speed) * MAX_SPEED
-                ball_dy = (ball_dy / speed) * MAX_SPEED
-
-        if ball.colliderect(paddle_right):
-            ball_dx = -abs(ball_dx)
-            last_hit = "right"
-            # Add spin while maintaining constant speed
-            ball_dy += paddle_right_speed * 0.1  # Reduced multiplier
-            ball_dy += (paddle_right.centery - ball.centery) * 0.05  # Angle adjustment
-            ball.x -= 5  # Move the ball slightly away from the paddle
-
-            # Normalize the speed
-            speed = (ball_dx * ball_dx + ball_dy * ball_dy) ** 0.5
-            if speed > MAX_SPEED:
-                ball_dx = (ball_dx / speed) * MAX_SPEED
-                ball_dy = (ball_dy / speed) * MAX_SPEED
-
-        # Lost round
-        if ball.left <= 0:
-            # Right scores
-            score_right += 1
-            reset_ball()
-            reset_paddles()
-            timer_start = pygame.time.get_ticks()
-            current_state = STATE_GRACE
-            check_for_winner()
-        elif ball.right >= WIDTH:
-            # Left scores
-            score_left += 1
-            reset_ball()
-            reset_paddles()
-            timer_start = pygame.time.get_ticks()
-            current_state = STATE_GRACE
-            check_for_winner()
-
-        # Collide with bricks
-        # If a brick is destroyed, give power-up to the player who hit it
-        for i, (brick_rect, brick_color) in enumerate(bricks):
-            if ball.colliderect(brick_rect):
-                del bricks[i]
-                ball_dy = -ball_dy
-                # 20% chance to get a power-up
-                if random.random() < 0.2:
-                    # Give power-up to the last player who hit the ball
-                    if last_hit == "left":
-                        paddle_left.height = int(paddle_left.height * 1.5)
-                        paddle_left.centery = paddle_left.centery
-                        paddle_left_end_power_time = pygame.time.get_ticks() + POWERUP_DURATION
-                    elif last_hit == "right":
-                        paddle_right.height = int(paddle_right.height * 1.5)
-                        paddle_right.centery = paddle_right.centery
-                        paddle_right_end_power_time = pygame.time.get_ticks() + POWERUP_DURATION                        
-                break
-
-        # Draw everything
-        screen.fill(BLACK)
-        pygame.draw.rect(screen, WHITE, paddle_left)
-        pygame.draw.rect(screen, WHITE, paddle_right)
-        pygame.draw.ellipse(screen, WHITE, ball)
-
-        for (brick_rect, brick_color) in bricks:
-            pygame.draw.rect(screen, brick_color, brick_rect)
-
-        # Score
-        score_text = score_font.render(f"{score_left} : {score_right}", True, WHITE)
-        score_rect = score_text.get_rect(center=(WIDTH // 2, 35))
-        screen.blit(score_text, score_rect)
-
-        draw_button(exit_button_rect, "EXIT")
-
-    elif current_state == STATE_GRACE:
-        screen.fill(BLACK)
-        pygame.draw.rect(screen, WHITE, paddle_left)
-        pygame.draw.rect(screen, WHITE, paddle_right)
-        pygame.draw.ellipse(screen, WHITE, ball)
-        for (brick_rect, brick_color) in bricks:
-            pygame.draw.rect(screen, brick_color, brick_rect)
-
-        score_text = score_font.render(f"{score_left} : {score_right}", True, WHITE)
-        score_rect = score_text.get_rect(center=(WIDTH // 2, 35))
-        screen.blit(score_text, score_rect)
-
-        if pygame.time.get_ticks() - timer_start >= 1000:
-            if current_state == STATE_GRACE:
-                current_state = STATE_GAME
-                create_bricks()  # to regenerate blocks after each round
+            for (brick_rect, brick_color) in bricks:
+                pygame.draw.rect(screen, brick_color, brick_rect)
 
-        draw_button(exit_button_rect, "EXIT")
+            # Score
+            score_text = score_font.render(f"{score_left} : {score_right}", True, WHITE)
+            score_rect = score_text.get_rect(center=(WIDTH // 2, 35))
+            screen.blit(score_text, score_rect)
 
-    elif current_state == STATE_GAME_OVER:
-        screen.fill(BLACK)
-        if game_winner:
-            text = f"{game_winner} PLAYER WINS!"
-        else:
-            text = "No Winner"
-        render_text_centered(text, title_font, TITLE_COLOR, HEIGHT // 2 - 30)
-        draw_button(menu_button_rect, "BACK TO MENU", small_menu_font)
+            draw_button(exit_button_rect, "EXIT")
 
-    pygame.display.flip()
+        elif current_state == STATE_GRACE:
+            screen.fill(BLACK)
+            pygame.draw.rect(screen, WHITE, paddle_left)
+            pygame.draw.rect(screen, WHITE, paddle_right)
+            pygame.draw.ellipse(screen, WHITE, ball)
+            for (brick_rect, brick_color) in bricks:
+                pygame.draw.rect(screen, brick_color, brick_rect)
 
-pygame.quit()
-sys.exit()
+            score_text = score_font.render(f"{score_left} : {score_right}", True, WHITE)
+            score_rect = score_text.get_rect(center=(WIDTH // 2, 35))
+            screen.blit(score_text, score_rect)
+
+            if pygame.time.get_ticks() - timer_start >= 1000:
+                if current_state == STATE_GRACE:
+                    current_state = STATE_GAME
+                    create_bricks()  # to regenerate blocks after each round
+
+            draw_button(exit_button_rect, "EXIT")
+
+        elif current_state == STATE_GAME_OVER:
+            screen.fill(BLACK)
+            if game_winner:
+                text = f"{game_winner} PLAYER WINS!"
+            else:
+                text = "No Winner"
+            render_text_centered(text, title_font, TITLE_COLOR, HEIGHT // 2 - 30)
+            draw_button(menu_button_rect, "BACK TO MENU", small_menu_font)
+
+        pygame.display.flip()
+
+    pygame.quit()
+    sys.exit()
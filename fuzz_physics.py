@@ -0,0 +1,478 @@
+"""
+Headless physics fuzzer for BreakPong.
+
+Drives the GAME-state physics in breakpong.py (move_paddles / update_ball)
+with seeded random paddle input, frame by frame, on every core, and checks
+after each frame that:
+
+  - the ball stays inside the arena,
+  - the ball speed stays bounded,
+  - the ball never gets stuck (in a paddle, past a wall, or not moving),
+  - scores and brick counts only change the way the rules allow.
+
+Failing seeds are minimized (idle frames replace as much input as
+possible) and can be saved as JSON reproducers. Golden trajectories can
+be recorded and compared so a rewrite of the physics can be shown to be
+behaviour-identical.
+
+Usage:
+  python fuzz_physics.py --seeds 1000 --frames 2000
+  python fuzz_physics.py --replay failures/arena-42.json
+  python fuzz_physics.py --record-golden golden_trajectories.json
+  python fuzz_physics.py --check-golden golden_trajectories.json
+"""
+import argparse
+import hashlib
+import json
+import math
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+# --------------------
+# Fuzzer Settings
+# --------------------
+FRAME_MS = 1000 / 60        # The game runs at 60 FPS
+GRACE_MS = 1000             # Matches the GRACE pause in the main loop
+STUCK_FRAMES = 3            # Frames the ball may overlap a paddle or sit past a wall in a row
+STALL_FRAMES = 120          # Frames the ball may go without moving sideways
+SPEED_EPSILON = 1e-9
+CHECKPOINT_EVERY = 250      # Frames between stored golden checkpoints
+
+GOLDEN_SEEDS = 32
+GOLDEN_FRAMES = 3000
+
+NO_INPUT = (False, False, False, False)
+
+bp = None
+
+
+def load_game():
+    """
+    Import breakpong without opening a real window or sound device.
+    Importing it does not start the main loop.
+    """
+    global bp
+    if bp is None:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+        # Otherwise SDL swallows SIGTERM and Pool.terminate() hangs
+        os.environ.setdefault("SDL_NO_SIGNAL_HANDLERS", "1")
+        # breakpong loads assets/ relative to the working directory
+        cwd = os.getcwd()
+        os.chdir(os.path.dirname(os.path.abspath(__file__)))
+        try:
+            import breakpong
+        finally:
+            os.chdir(cwd)
+        bp = breakpong
+    return bp
+
+
+class InvariantViolation(Exception):
+    """A broken invariant, or "crash" when the game code itself raised."""
+
+    def __init__(self, invariant, frame, message):
+        super().__init__(f"frame {frame}: {invariant}: {message}")
+        self.invariant = invariant
+        self.frame = frame
+        self.message = message
+
+
+# --------------------
+# Simulation
+# --------------------
+def frame_time(frame):
+    return int(frame * FRAME_MS)
+
+
+def snapshot():
+    """Everything the physics can change, in a stable order."""
+    return (
+        bp.current_state,
+        bp.ball.x, bp.ball.y, bp.ball_dx, bp.ball_dy,
+        bp.paddle_left.y, bp.paddle_left.height,
+        bp.paddle_right.y, bp.paddle_right.height,
+        bp.score_left, bp.score_right,
+        len(bp.bricks), bp.last_hit,
+    )
+
+
+def new_match(rng, now):
+    """Start a match the way the START button does, minus the countdown."""
+    bp.paddle_left_end_power_time = 0
+    bp.paddle_right_end_power_time = 0
+    bp.last_hit = None
+    bp.game_winner = None
+    bp.start_match(now)
+    bp.current_state = bp.STATE_GAME
+    bp.ball_dx = rng.choice((-1, 1)) * bp.BALL_SPEED
+    bp.ball_dy = rng.choice((-1, 1)) * bp.BALL_SPEED
+    bp.paddle_left.y = rng.randint(0, bp.HEIGHT - bp.PADDLE_HEIGHT)
+    bp.paddle_right.y = rng.randint(0, bp.HEIGHT - bp.PADDLE_HEIGHT)
+
+
+class InputGenerator:
+    """
+    Seeded paddle input. Each paddle alternates between holding a random
+    key for a while and chasing the ball, so rallies (and with them the
+    paddle-collision code) actually get exercised.
+    """
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.modes = [None, None]
+        self.left = [0, 0]
+
+    def _paddle(self, side, paddle):
+        if self.left[side] <= 0:
+            self.modes[side] = self.rng.choice(("up", "down", "idle", "track", "track"))
+            self.left[side] = self.rng.randint(1, 40)
+        self.left[side] -= 1
+
+        mode = self.modes[side]
+        if mode == "track":
+            offset = bp.ball.centery - paddle.centery
+            return offset < -bp.PADDLE_SPEED, offset > bp.PADDLE_SPEED
+        return mode == "up", mode == "down"
+
+    def next(self):
+        left_up, left_down = self._paddle(0, bp.paddle_left)
+        right_up, right_down = self._paddle(1, bp.paddle_right)
+        return (left_up, left_down, right_up, right_down)
+
+
+def run(seed, frames, inputs=None, check=True, on_frame=None, used=None):
+    """
+    Simulate `frames` frames for `seed`. With `inputs` the paddle input is
+    replayed from that list (missing frames are idle), otherwise it is
+    generated from the seed. Returns the input actually used, which is
+    also appended to `used` if given, so it survives an exception.
+    Raises InvariantViolation on the first broken invariant when `check`,
+    and always when the game code raises (as invariant "crash").
+    """
+    load_game()
+    rng = random.Random(seed)  # match setup only, so replays draw the same values
+    random.seed(seed)  # brick colours and power-up rolls inside the game
+    new_match(rng, 0)
+    generator = InputGenerator(random.Random(f"{seed}-input")) if inputs is None else None
+    used = [] if used is None else used
+
+    paddle_frames = 0
+    wall_frames = 0
+    stall_frames = 0
+    frame = 0
+    try:
+        for frame in range(frames):
+            now = frame_time(frame)
+            bp.expire_power_ups(now)
+
+            if bp.current_state == bp.STATE_GRACE:
+                if now - bp.timer_start >= GRACE_MS:
+                    bp.current_state = bp.STATE_GAME
+                    bp.create_bricks()
+                used.append(NO_INPUT)
+            elif bp.current_state == bp.STATE_GAME_OVER:
+                new_match(rng, now)
+                used.append(NO_INPUT)
+            else:
+                if generator is not None:
+                    keys = generator.next()
+                elif frame < len(inputs):
+                    keys = tuple(inputs[frame])
+                else:
+                    keys = NO_INPUT
+                used.append(keys)
+
+                before = snapshot()
+                bricks_before = [rect.copy() for rect, _ in bp.bricks]
+                bp.move_paddles(*keys)
+                bp.update_ball(now)
+
+                if check:
+                    paddle_frames = paddle_frames + 1 if overlaps_paddle() else 0
+                    wall_frames = wall_frames + 1 if outside_walls() else 0
+                    stall_frames = stall_frames + 1 if bp.ball.x == before[1] else 0
+                    check_frame(frame, before, bricks_before, paddle_frames, wall_frames, stall_frames)
+
+            if on_frame is not None:
+                on_frame(frame)
+    except InvariantViolation:
+        raise
+    except Exception as err:  # a crash in the game code is a finding too
+        raise InvariantViolation("crash", frame, repr(err)) from err
+    return used
+
+
+def overlaps_paddle():
+    return bp.ball.colliderect(bp.paddle_left) or bp.ball.colliderect(bp.paddle_right)
+
+
+def outside_walls():
+    return bp.ball.top < 0 or bp.ball.bottom > bp.HEIGHT
+
+
+def check_frame(frame, before, bricks_before, paddle_frames, wall_frames, stall_frames):
+    scored = bp.current_state != bp.STATE_GAME
+    ball = bp.ball
+
+    # Ball within the arena: it may overshoot a wall by at most one frame
+    # of movement. Crossing a goal line always scores and re-centres it.
+    slack = math.ceil(bp.MAX_SPEED)
+    if ball.top < -slack or ball.bottom > bp.HEIGHT + slack:
+        raise InvariantViolation("arena", frame, f"ball {tuple(ball)} left the arena vertically")
+
+    # Bounded speed
+    speed = math.hypot(bp.ball_dx, bp.ball_dy)
+    if speed > bp.MAX_SPEED + SPEED_EPSILON:
+        raise InvariantViolation("speed", frame, f"speed {speed:.4f} > {bp.MAX_SPEED}")
+
+    # No stuck ball
+    if paddle_frames > STUCK_FRAMES:
+        raise InvariantViolation("stuck", frame, f"ball inside a paddle for {paddle_frames} frames")
+    if wall_frames > STUCK_FRAMES:
+        raise InvariantViolation("stuck", frame, f"ball past a wall for {wall_frames} frames (dy={bp.ball_dy:.4f})")
+    if stall_frames > STALL_FRAMES:
+        raise InvariantViolation("stuck", frame, f"ball has not moved sideways for {stall_frames} frames (dx={bp.ball_dx:.4f})")
+
+    # Consistent scores
+    gained_left = bp.score_left - before[9]
+    gained_right = bp.score_right - before[10]
+    if gained_left < 0 or gained_right < 0 or gained_left + gained_right > 1:
+        raise InvariantViolation("score", frame, f"score went {before[9]}:{before[10]} -> {bp.score_left}:{bp.score_right}")
+    if (gained_left + gained_right == 1) != scored:
+        raise InvariantViolation("score", frame, f"state {bp.current_state} does not match the score change")
+    if bp.current_state == bp.STATE_GAME_OVER and max(bp.score_left, bp.score_right) < bp.winning_score:
+        raise InvariantViolation("score", frame, "game over before anyone reached the winning score")
+
+    # Consistent bricks: at most one per frame, and only one the ball touched
+    lost = len(bricks_before) - len(bp.bricks)
+    if lost not in (0, 1):
+        raise InvariantViolation("bricks", frame, f"{len(bricks_before)} -> {len(bp.bricks)} bricks in one frame")
+    if lost == 1:
+        remaining = [tuple(rect) for rect, _ in bp.bricks]
+        broken = [rect for rect in bricks_before if tuple(rect) not in remaining]
+        if len(broken) != 1 or not ball.colliderect(broken[0]):
+            raise InvariantViolation("bricks", frame, f"brick {broken} removed without the ball touching it")
+
+
+# --------------------
+# Fuzzing & Minimization
+# --------------------
+def fuzz_seed(job):
+    """Worker entry point: returns (seed, frames_run, failure or None)."""
+    seed, frames = job
+    try:
+        inputs = run(seed, frames)
+    except InvariantViolation as err:
+        return seed, err.frame + 1, failure_record(seed, err, None)
+    return seed, len(inputs), None
+
+
+def failure_record(seed, err, inputs):
+    record = {"seed": seed, "invariant": err.invariant, "frame": err.frame, "message": err.message}
+    if inputs is not None:
+        record["frames"] = err.frame + 1
+        record["inputs"] = {str(i): list(keys) for i, keys in enumerate(inputs) if keys != NO_INPUT}
+    return record
+
+
+def failure_of(seed, frames, inputs):
+    try:
+        run(seed, frames, inputs)
+    except InvariantViolation as err:
+        return err
+    return None
+
+
+def minimize(job):
+    """
+    Shrink a failing seed: cut the run off at the failing frame, then
+    replace chunks of paddle input with idle frames (halving the chunk
+    size each pass) for as long as the same invariant still breaks.
+    """
+    seed, frames, invariant = job
+    try:
+        run(seed, frames)
+    except InvariantViolation as err:
+        failure = err
+    else:
+        return None
+    inputs = []
+    try:
+        run(seed, failure.frame + 1, check=False, used=inputs)
+    except InvariantViolation:
+        pass  # crashes still raise without checks
+    # Only shrink input that fails the same way when replayed.
+    err = failure_of(seed, len(inputs), inputs)
+    if err is None or err.invariant != invariant:
+        return None
+    failure = err
+
+    chunk = max(1, len(inputs) // 2)
+    while True:
+        start = 0
+        while start < len(inputs):
+            end = min(len(inputs), start + chunk)
+            if any(keys != NO_INPUT for keys in inputs[start:end]):
+                candidate = inputs[:start] + [NO_INPUT] * (end - start) + inputs[end:]
+                err = failure_of(seed, len(candidate), candidate)
+                if err is not None and err.invariant == invariant:
+                    inputs = candidate[:err.frame + 1]
+                    failure = err
+            start = end
+        if chunk == 1:
+            break
+        chunk //= 2
+    return failure_record(seed, failure, inputs)
+
+
+def fuzz(args):
+    jobs = [(seed, args.frames) for seed in range(args.start, args.start + args.seeds)]
+    failures = []
+    total_frames = 0
+    began = time.time()
+    with multiprocessing.Pool(args.jobs, initializer=load_game) as pool:
+        for seed, frames_run, failure in pool.imap_unordered(fuzz_seed, jobs, chunksize=8):
+            total_frames += frames_run
+            if failure is not None:
+                failures.append(failure)
+
+        elapsed = time.time() - began
+        print(f"{len(jobs)} seeds, {total_frames} frames in {elapsed:.1f}s "
+              f"({total_frames / max(elapsed, 1e-9):.0f} frames/s), {len(failures)} failing")
+
+        # Minimize the first few seeds of each kind of failure
+        by_kind = {}
+        for failure in sorted(failures, key=lambda f: (f["invariant"], f["frame"])):
+            by_kind.setdefault(failure["invariant"], []).append(failure)
+        to_minimize = [
+            (failure["seed"], failure["frame"] + 1, failure["invariant"])
+            for kind in by_kind.values() for failure in kind[:args.minimize]
+        ]
+        minimized = [record for record in pool.map(minimize, to_minimize) if record]
+        if len(minimized) < len(to_minimize):
+            print(f"  {len(to_minimize) - len(minimized)} failing seeds did not reproduce on replay")
+
+    for kind, group in by_kind.items():
+        print(f"  {kind}: {len(group)} seeds, e.g. seed {group[0]['seed']}: {group[0]['message']}")
+    for record in minimized:
+        print(f"  minimized seed {record['seed']} ({record['invariant']}): "
+              f"{record['frames']} frames, {len(record['inputs'])} input frames")
+        if args.save_failures:
+            os.makedirs(args.save_failures, exist_ok=True)
+            path = os.path.join(args.save_failures, f"{record['invariant']}-{record['seed']}.json")
+            with open(path, "w") as f:
+                json.dump(record, f, indent=2)
+    return 1 if failures else 0
+
+
+def replay(path):
+    with open(path) as f:
+        record = json.load(f)
+    inputs = [NO_INPUT] * record["frames"]
+    for frame, keys in record["inputs"].items():
+        inputs[int(frame)] = tuple(keys)
+    err = failure_of(record["seed"], record["frames"], inputs)
+    if err is None:
+        print(f"seed {record['seed']}: no longer fails")
+        return 0
+    print(f"seed {record['seed']}: {err}")
+    return 1
+
+
+# --------------------
+# Golden Trajectories
+# --------------------
+def trajectory(job):
+    """Digest of every frame of a run, plus a snapshot every CHECKPOINT_EVERY frames."""
+    seed, frames = job
+    digest = hashlib.sha256()
+    checkpoints = []
+
+    def on_frame(frame):
+        state = snapshot()
+        digest.update(repr(state).encode())
+        if frame % CHECKPOINT_EVERY == 0 or frame == frames - 1:
+            checkpoints.append([frame, list(state)])
+
+    run(seed, frames, check=False, on_frame=on_frame)
+    return {"seed": seed, "digest": digest.hexdigest(), "checkpoints": checkpoints}
+
+
+def golden_runs(args, seeds, frames):
+    with multiprocessing.Pool(args.jobs, initializer=load_game) as pool:
+        return pool.map(trajectory, [(seed, frames) for seed in seeds])
+
+
+def record_golden(args):
+    seeds = list(range(args.start, args.start + args.seeds))
+    runs = golden_runs(args, seeds, args.frames)
+    golden = {"pygame": load_game().pygame.version.ver, "frames": args.frames, "runs": runs}
+    with open(args.record_golden, "w") as f:
+        json.dump(golden, f, indent=1)
+    print(f"recorded {len(runs)} golden trajectories of {args.frames} frames to {args.record_golden}")
+    return 0
+
+
+def check_golden(args):
+    with open(args.check_golden) as f:
+        golden = json.load(f)
+    pygame = load_game().pygame
+    if golden["pygame"] != pygame.version.ver:
+        print(f"warning: golden file was recorded with pygame {golden['pygame']}, "
+              f"running {pygame.version.ver}")
+
+    expected = {run["seed"]: run for run in golden["runs"]}
+    runs = golden_runs(args, sorted(expected), golden["frames"])
+    mismatches = 0
+    for run in runs:
+        want = expected[run["seed"]]
+        if run["digest"] == want["digest"]:
+            continue
+        mismatches += 1
+        for (frame, state), (_, want_state) in zip(run["checkpoints"], want["checkpoints"]):
+            if state != want_state:
+                print(f"seed {run['seed']}: diverged by frame {frame}\n"
+                      f"  expected {want_state}\n  got      {state}")
+                break
+        else:
+            print(f"seed {run['seed']}: diverged between checkpoints")
+    print(f"{len(runs) - mismatches}/{len(runs)} trajectories match {args.check_golden}")
+    return 1 if mismatches else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fuzz BreakPong's ball physics headless.")
+    parser.add_argument("--seeds", type=int, default=None, help="number of seeds to run")
+    parser.add_argument("--start", type=int, default=0, help="first seed")
+    parser.add_argument("--frames", type=int, default=None, help="frames per seed")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--minimize", type=int, default=3, help="failing seeds to minimize per invariant")
+    parser.add_argument("--save-failures", metavar="DIR", help="write minimized reproducers here")
+    parser.add_argument("--replay", metavar="FILE", help="replay a saved reproducer")
+    parser.add_argument("--record-golden", metavar="FILE", help="record golden trajectories")
+    parser.add_argument("--check-golden", metavar="FILE", help="compare against golden trajectories")
+    args = parser.parse_args()
+    for name in ("save_failures", "replay", "record_golden", "check_golden"):
+        if getattr(args, name):
+            setattr(args, name, os.path.abspath(getattr(args, name)))
+
+    if args.replay:
+        return replay(args.replay)
+    if args.record_golden:
+        args.seeds = args.seeds or GOLDEN_SEEDS
+        args.frames = args.frames or GOLDEN_FRAMES
+        return record_golden(args)
+    if args.check_golden:
+        return check_golden(args)
+    args.seeds = args.seeds or 1000
+    args.frames = args.frames or 2000
+    return fuzz(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())